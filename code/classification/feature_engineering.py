@@ -70,7 +70,10 @@ class FeatureEngineering:
 
         X = extract_features(for_tsfresh, column_id='id',
                              column_sort='time', n_jobs=16)
-        features = np.zeros((data.shape[0], self.tsfresh_num_features))
+        # XGBoost converts its input to float32, so we store the features
+        # in single precision to avoid holding a float64 copy
+        features = np.zeros((data.shape[0], self.tsfresh_num_features),
+                            dtype=np.float32)
         for i in range(0, data.shape[0]):
             for j in range(0, self.tsfresh_num_features):
                 idx = int(X.columns[self.tsfresh_num_features * i + j].split(
@@ -83,14 +86,8 @@ class FeatureEngineering:
                 temp_feature_keys, variables)
 
         # bring the features from format [num_data*num_features, len_winter] to
-        # [num_data, num_features*len_winter]
+        # [num_data, num_features*len_winter]. Consecutive rows belong to the
+        # same data point, so this is a view
         length = len(variables)
-        new_features = [
-                np.concatenate((features[i - 2], features[i - 1],
-                                features[i]), axis=0)
-                for i, feature in enumerate(features)
-                if i % length == 2
-                ]
-
-        features = new_features[:]
-        return feature_keys, np.asarray(features)
+        features = features.reshape(len(features) // length, -1)
+        return feature_keys, features
@@ -1,16 +1,22 @@
 import argparse
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
-from sklearn.base import BaseEstimator, TransformerMixin
+from sklearn.base import BaseEstimator, TransformerMixin, clone
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.metrics import make_scorer, f1_score, roc_auc_score, \
     accuracy_score
 from sklearn.model_selection import cross_validate, StratifiedKFold
 from sklearn.pipeline import Pipeline
+from sklearn.utils.validation import check_is_fitted
+from xgboost import XGBClassifier
 
 from core.data_manager import DataManager
 import os
 import numpy as np
-import matplotlib.pyplot as ply
+import psutil
+from joblib import Memory, dump, load
+from numba import njit, prange
 from utils.dslab_logging import get_logger
 from utils.output_class import Output
 from utils.set_seed import SetSeed
@@ -21,9 +27,197 @@ from preprocessing.dataset import DatapointKey as DK
 logger = get_logger()
 SetSeed().set_seed()
 
+# Hyper-threads compete for the same core during tree building, so we only
+# use as many jobs as there are physical cores. If psutil cannot tell the
+# number of physical cores, we fall back to the logical ones
+N_CORES = psutil.cpu_count(logical=False) or os.cpu_count() or 1
+
+# Reading the variables from the h5 files is slow, so the loaded data is
+# cached on disk across runs
+CACHE_DIR = os.getenv(
+    "DSLAB_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..",
+                 ".cache"))
+_memory = None
+
+
+def _get_memory():
+    """
+    Returns the joblib.Memory that caches the loaded data. It is created on
+    first use, so that importing this module does not create CACHE_DIR.
+    """
+    global _memory
+    if _memory is None:
+        _memory = Memory(CACHE_DIR, verbose=0)
+    return _memory
+
+
+def _load_variables(path, variables, modified):
+    # modified is only part of the cache key
+    return DataManager(path).get_data_for_variables(variables)
+
+
+def _load_labels(path, definition, modified):
+    # modified is only part of the cache key
+    raw_labels = DataManager(path).get_data_for_variable(definition)
+    # A winter is labeled positive if there is any event in it
+    return (raw_labels == 1).any(axis=1).astype(np.int8)
+
+
+def load_variables(path, variables):
+    """
+    Loads the data for the given variables. The result is cached on disk
+    until the file changes.
+
+    Parameters
+    ----------
+        path: string
+            the path of the h5 file
+        variables: list
+            the variables to load
+
+    Returns
+    -------
+        data: np.array
+            array of shape (n_samples, n_variables, n_days)
+    """
+    return _get_memory().cache(_load_variables)(
+        path, variables, os.path.getmtime(path))
+
+
+def load_labels(path, definition):
+    """
+    Loads the binary labels for the given definition. The result is cached
+    on disk until the file changes.
+
+    Parameters
+    ----------
+        path: string
+            the path of the h5 file
+        definition: string
+            the definition to load the labels for, e.g. "CP07"
+
+    Returns
+    -------
+        labels: np.array
+            array of shape (n_samples,)
+    """
+    return _get_memory().cache(_load_labels)(
+        path, definition, os.path.getmtime(path))
+
+
+@njit(parallel=True)
+def _hist_kernel(data, out, lo, hi, edges, n_bins):
+    """
+    Counts the values of data of shape (n_samples, n_features, n_days)
+    into out of shape (n_samples, n_features, n_bins), using the histogram
+    range [lo[f], hi[f]] and the bin edges edges[f] for feature f. Values
+    outside of the range are ignored, as done by np.histogram.
+    """
+    n_samples, n_features, n_days = data.shape
+    for i in prange(n_samples):
+        for f in range(n_features):
+            inv = n_bins / (hi[f] - lo[f])
+            for d in range(n_days):
+                v = data[i, f, d]
+                # The negated comparison also skips NaNs
+                if not (v >= lo[f] and v <= hi[f]):
+                    continue
+                b = int((v - lo[f]) * inv)
+                if b < 0:
+                    b = 0
+                elif b >= n_bins:
+                    b = n_bins - 1
+                # Rounding can put values lying on a bin edge into the
+                # neighbouring bin, so we compare against the edges like
+                # np.histogram does
+                if b > 0 and v < edges[f, b]:
+                    b -= 1
+                elif b != n_bins - 1 and v >= edges[f, b + 1]:
+                    b += 1
+                out[i, f, b] += 1
+
+
+@njit(cache=True)
+def _minmax_kernel(data):
+    """
+    Computes the minimum and maximum of every feature of data of shape
+    (n_samples, n_features, n_days) in a single pass over the data. Like
+    np.min and np.max, NaNs propagate to the result.
+    """
+    n_samples, n_features, n_days = data.shape
+    lo = np.empty(n_features, data.dtype)
+    hi = np.empty(n_features, data.dtype)
+    for f in range(n_features):
+        lo[f] = data[0, f, 0]
+        hi[f] = data[0, f, 0]
+    for i in range(n_samples):
+        for f in range(n_features):
+            for d in range(n_days):
+                v = data[i, f, d]
+                if v != v:
+                    # No value compares smaller or larger than NaN, so it
+                    # stays the result
+                    lo[f] = v
+                    hi[f] = v
+                elif v < lo[f]:
+                    lo[f] = v
+                elif v > hi[f]:
+                    hi[f] = v
+    return lo, hi
+
+
+STRATEGIES = ('uniform', 'quantile')
+
+
+def check_strategy(strategy):
+    """
+    Raises a ValueError if strategy is not a known binning strategy.
+
+    Parameters
+    ----------
+        strategy: string
+            the binning strategy, one of STRATEGIES
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError("Unknown binning strategy '{}', choose one of "
+                         "{}".format(strategy, ", ".join(STRATEGIES)))
+
+
+def histogram_range(data):
+    """
+    Computes the histogram range of every variable over all samples.
+
+    Parameters
+    ----------
+        data: numpy.array
+            array of shape (num_data, num_variables, num_days)
+
+    Returns
+    -------
+        lo, hi: np.array
+            arrays of shape (num_variables,) with the lower and upper
+            bounds of the histograms
+
+    Raises
+    ------
+        ValueError
+            if data is empty or a variable contains non-finite values
+    """
+    if data.size == 0:
+        raise ValueError("Cannot compute the histogram range of empty data")
+    lo, hi = _minmax_kernel(data)
+    if not (np.isfinite(lo).all() and np.isfinite(hi).all()):
+        raise ValueError("The histogram range of the data is not finite")
+    # Like np.histogram, we widen an empty range to avoid zero-width bins
+    empty = lo == hi
+    lo = np.where(empty, lo - 0.5, lo)
+    hi = np.where(empty, hi + 0.5, hi)
+    return lo, hi
+
 
 class HistogramTransformer(BaseEstimator, TransformerMixin):
-    def __init__(self, n_bins=100):
+    def __init__(self, n_bins=100, hist_range=None, strategy='uniform'):
         """
         Transformer that produces histogram features
 
@@ -31,53 +225,120 @@ class HistogramTransformer(BaseEstimator, TransformerMixin):
         ----------
             n_bins: int
                 number of bins to use in the histograms
+            hist_range: tuple of np.array
+                precomputed histogram range as returned by histogram_range.
+                If None, the range is computed from the transformed data.
+                Only used by the 'uniform' strategy.
+            strategy: string
+                'uniform' for bins of equal width over the histogram range,
+                'quantile' for bins with an equal number of values, whose
+                edges are learned in fit. Repeated quantiles are merged, so
+                a variable can get fewer than n_bins bins.
         """
         self.n_bins = n_bins
+        self.hist_range = hist_range
+        self.strategy = strategy
 
-    def _histograms_for_variable(self, array, n_bins):
+    def _histograms(self, data, n_bins=100):
         """
-        Computes the histograms for array of shape (n_samples, n_days)
+        Creates histogram features for given variables.
+        For each variable, we create a histogram with n_bins.
+        The histogram range of a variable is computed over all samples.
 
         Parameters
         ----------
-            array: np.array
-                array of shape (n_samples, n_days)
+            data: numpy.array
+                contains the preprocessed data
+                of shape (num_data, num_variables, num_days)
             n_bins: int
                 number of bins to use in the histograms
-        """
-        # Compute the histogram range over all given samples in array
-        hist_range = [np.min(array), np.max(array)]
 
-        histograms = np.apply_along_axis(
-            lambda a: np.histogram(a, bins=n_bins, range=hist_range)[0],
-            axis=1,
-            arr=array)
+        Returns
+        -------
+            histograms: np.array
+                array of shape (num_data, num_variables, n_bins)
+        """
+        n_samples, n_features = data.shape[:2]
+        if self.hist_range is None:
+            lo, hi = histogram_range(data)
+        else:
+            lo, hi = self.hist_range
+
+        # Bin edges are computed in the precision of the data, as done
+        # by np.histogram
+        dtype = np.result_type(data.dtype, np.float32)
+        lo, hi = lo.astype(dtype), hi.astype(dtype)
+        step = (hi - lo) / n_bins
+        edges = np.arange(n_bins + 1, dtype=dtype) * step[:, None] + \
+            lo[:, None]
+        edges[:, -1] = hi
+
+        # The counts are bounded by the number of days, so 16 bits suffice
+        histograms = np.zeros((n_samples, n_features, n_bins),
+                              dtype=np.uint16)
+        _hist_kernel(data, histograms, lo.astype(np.float64),
+                     hi.astype(np.float64), edges, n_bins)
         return histograms
 
-    def _histograms(self, data, n_bins=100):
+    def _quantile_histograms_for_variable(self, array, edges):
         """
-        Creates histogram features for given variables.
-        For each variable, we create a histogram with n_bins.
+        Computes the histograms for array of shape (n_samples, n_days)
+        with the given bin edges.
+
+        Parameters
+        ----------
+            array: np.array
+                array of shape (n_samples, n_days)
+            edges: np.array
+                array of shape (n_bins + 1,) with the bin edges
+        """
+        n_samples = array.shape[0]
+        n_bins = len(edges) - 1
+        # Values outside of the fitted edges are counted in the outer bins
+        idx = np.searchsorted(edges, array, side='right') - 1
+        idx = np.clip(idx, 0, n_bins - 1)
+        # Offset the bin indices by row so that a single bincount yields
+        # the histograms of all samples
+        idx += np.arange(n_samples)[:, None] * n_bins
+        histograms = np.bincount(idx.ravel(), minlength=n_samples * n_bins)
+        return histograms.reshape(n_samples, n_bins)
+
+    def _quantile_histograms(self, data):
+        """
+        Creates histogram features for given variables using the bin edges
+        learned in fit.
 
         Parameters
         ----------
             data: numpy.array
                 contains the preprocessed data
                 of shape (num_data, num_variables, num_days)
-            n_bins: int
-                number of bins to use in the histograms
 
+        Returns
+        -------
+            histograms: np.array
+                array of shape (num_data, total number of bins) with the
+                histograms of the variables next to each other
         """
-        n_features = data.shape[1]
-        # For each feature variable, compute the histograms for all samples
-        result = np.array([
-            self._histograms_for_variable(data[:, i, :], n_bins=n_bins)
-            for i in range(n_features)
-        ])
-        # result has shape (n_features, n_samples, n_bins)
-        # We reshape it to have the shape (n_samples, n_features, n_bins)
-        result = np.swapaxes(result, 0, 1)
-        return result
+        check_is_fitted(self, 'edges_')
+        n_samples, n_features = data.shape[:2]
+        # The variables can have different numbers of bins, so we compute
+        # where the histogram of each variable starts in the output
+        offsets = np.cumsum([0] + [len(edges) - 1 for edges in self.edges_])
+        # We write the histograms of every variable directly into the
+        # output, so no intermediate list of histograms is created
+        histograms = np.empty((n_samples, offsets[-1]), dtype=np.uint16)
+
+        def fill(i):
+            histograms[:, offsets[i]:offsets[i + 1]] = \
+                self._quantile_histograms_for_variable(data[:, i, :],
+                                                       self.edges_[i])
+
+        # NumPy releases the GIL while binning, so the variables are
+        # processed in parallel threads
+        with ThreadPoolExecutor(max_workers=n_features) as executor:
+            list(executor.map(fill, range(n_features)))
+        return histograms
 
     def transform(self, X, y=None, **fit_params):
         """
@@ -89,26 +350,99 @@ class HistogramTransformer(BaseEstimator, TransformerMixin):
                 array of shape (n_samples, n_features, n_days)
             y: None
         """
-
-        histogram_features = self._histograms(X, n_bins=self.n_bins)
-        # We need to reshape the array of shape (n_samples, n_features, n_bins)
-        # to (n_samples, n_features * n_bins)
-        X = np.reshape(histogram_features, (histogram_features.shape[0], -1))
-        return X
+        check_strategy(self.strategy)
+        if self.strategy == 'quantile':
+            X = self._quantile_histograms(X)
+        else:
+            histogram_features = self._histograms(X, n_bins=self.n_bins)
+            # We need to reshape the array of shape
+            # (n_samples, n_features, n_bins) to
+            # (n_samples, n_features * n_bins)
+            X = np.reshape(histogram_features,
+                           (histogram_features.shape[0], -1))
+        # The classifiers work on float32, so we avoid a float64 copy
+        return X.astype(np.float32)
 
     def fit(self, X, y=None, **fit_params):
-        # No fitting required
+        """
+        Learns the bin edges of every variable for the 'quantile' strategy.
+        The 'uniform' strategy requires no fitting.
+
+        Parameters
+        ----------
+            X: np.array
+                array of shape (n_samples, n_features, n_days)
+            y: None
+        """
+        check_strategy(self.strategy)
+        if self.strategy == 'quantile':
+            quantiles = np.linspace(0, 1, self.n_bins + 1)
+            self.edges_ = []
+            for i in range(X.shape[1]):
+                # Skewed or discrete variables have repeated quantiles, which
+                # would create bins that are always empty, so we merge them
+                edges = np.unique(np.quantile(X[:, i, :], quantiles))
+                if len(edges) == 1:
+                    # Like np.histogram, we widen an empty range
+                    edges = np.array([edges[0] - 0.5, edges[0] + 0.5])
+                self.edges_.append(edges)
         return self
 
 
+class HistogramData():
+    """Holds a fixed data set, so that runs with different numbers of bins
+    share the loaded data. Only the histogram range is shared between the
+    runs; it is computed the first time features are requested. The
+    features themselves are not stored, as every number of bins is usually
+    requested once.
+    """
+
+    def __init__(self, data):
+        """
+        Parameters
+        ----------
+            data: np.array
+                array of shape (n_samples, n_features, n_days)
+        """
+        self.data = data
+        self.hist_range = None
+
+    def get_features(self, n_bins):
+        """
+        Returns the uniform histogram features for n_bins.
+
+        Parameters
+        ----------
+            n_bins: int
+                number of bins to use in the histograms
+
+        Returns
+        -------
+            features: np.array
+                array of shape (n_samples, n_features * n_bins)
+        """
+        if self.hist_range is None:
+            self.hist_range = histogram_range(self.data)
+        transformer = HistogramTransformer(n_bins=n_bins,
+                                           hist_range=self.hist_range)
+        return transformer.transform(self.data)
+
+
 class RandomForestClassification():
     """A class that receives as input the processed data and the definition that
     you want prediction for and does prediction using the RandomForest
     Classifier.
+
+    Attributes
+    ----------
+    variables: list
+        The variables used to extract the histogram features
     """
+    variables = [DK.TEMP_60_90, DK.WIND_60, DK.WIND_65]
 
     def __init__(self, definition, path_train, n_bins=100, n_estimators=100,
-                 cv_folds=5, path_test=None):
+                 cv_folds=5, path_test=None, boosting=False,
+                 strategy='uniform'):
         """
         Parameters
         ----------
@@ -121,54 +455,114 @@ class RandomForestClassification():
                 number of bins to use for the histogram extraction
             n_estimators: int
                 number of estimators to use in the RandomForestClassifier
+            boosting: bool
+                Whether to use a histogram-based XGBClassifier instead of the
+                RandomForestClassifier
+            strategy: string
+                the binning strategy of the HistogramTransformer, 'uniform'
+                or 'quantile'
 
         """
-        self.data_manager_train = DataManager(path_train)
-        if path_test:
-            self.data_manager_test = DataManager(path_test)
+        self.path_train = path_train
+        self.path_test = path_test
 
         self.definition = definition
 
         self.cv_folds = cv_folds
         self.n_bins = n_bins
+        check_strategy(strategy)
+        self.strategy = strategy
 
         self.metric_txt = ["F1", "ROCAUC", "Accuracy"]
         self.metrics = [f1_score, roc_auc_score, accuracy_score]
-        self.classifier = RandomForestClassifier(
-            n_estimators=n_estimators,
-            n_jobs=4
-        )
+        # The folds of the cross-validation are run in parallel, so each
+        # model is built by a single job
+        if boosting:
+            # The histogram counts take at most n_days distinct values, so
+            # the default 256 bins of tree_method='hist' lose no information
+            if strategy == 'quantile':
+                self.classifier_type = Classifier.xgboost_hist_quantile
+            else:
+                self.classifier_type = Classifier.xgboost_hist
+            self.classifier = XGBClassifier(
+                n_estimators=n_estimators,
+                tree_method='hist',
+                n_jobs=1
+            )
+        else:
+            if strategy == 'quantile':
+                self.classifier_type = Classifier.randomforest_quantile
+            else:
+                self.classifier_type = Classifier.randomforest
+            # The folds are fitted in worker processes that do not share
+            # the seeded global random state, so we draw the seed here
+            self.classifier = RandomForestClassifier(
+                n_estimators=n_estimators,
+                n_jobs=1,
+                random_state=np.random.randint(np.iinfo(np.int32).max)
+            )
 
     def _get_raw_data(self, train=True):
-        variables = [DK.TEMP_60_90, DK.WIND_60, DK.WIND_65]
-        if train:
-            data = self.data_manager_train.get_data_for_variables(variables)
-        else:
-            data = self.data_manager_test.get_data_for_variables(variables)
-        return data
+        path = self.path_train if train else self.path_test
+        return load_variables(path, self.variables)
 
     def _get_labels(self, train=True):
-        if train:
-            raw_labels = self.data_manager_train.get_data_for_variable(
-                self.definition)
-        else:
-            raw_labels = self.data_manager_test.get_data_for_variable(
-                self.definition)
-        binary_label = np.apply_along_axis(lambda a: 1 if 1 in a else 0,
-                                           axis=1, arr=raw_labels)
-        return binary_label
+        path = self.path_train if train else self.path_test
+        return load_labels(path, self.definition)
 
     def _get_pipeline(self):
         # We create a pipeline in order to apply the same independent
-        # preprocessing steps to all folds in the cross-validation
-        feature_extraction = HistogramTransformer(n_bins=self.n_bins)
+        # preprocessing steps to the training and the test data
+        feature_extraction = HistogramTransformer(n_bins=self.n_bins,
+                                                  strategy=self.strategy)
+        # The model is cloned, so that changing the parameters of the
+        # pipeline does not change self.classifier
         steps = [
             ('feature_extraction', feature_extraction),
-            ('model', self.classifier)
+            ('model', clone(self.classifier))
         ]
         return Pipeline(steps)
 
-    def evaluate_simulated(self, plot=False):
+    def _cross_validate(self, estimator, X_train, labels_train):
+        """
+        Scores the estimator in a stratified cross validation whose folds
+        are run in parallel.
+
+        Parameters
+        ----------
+            estimator: estimator
+                the classifier or pipeline to evaluate
+            X_train: np.array
+                the input of the estimator
+            labels_train: np.array
+                array of shape (n_samples,)
+
+        Returns
+        -------
+            scores: list of length len(self.metrics) with the scores of
+            every fold
+        """
+        # We have an unbalanced dataset, so we stratify
+        cv = StratifiedKFold(self.cv_folds, shuffle=True)
+
+        logger.info("Scoring for {} metrics...".format(len(self.metrics)))
+        # Produce scores for all scoring metrics
+        scorers = {txt: make_scorer(metric) for txt, metric in
+                   zip(self.metric_txt, self.metrics)}
+        # The parallel folds share a read-only memory map of the data
+        # instead of receiving a pickled copy each
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'X_train.joblib')
+            dump(X_train, path)
+            X_train = load(path, mmap_mode='r')
+            scores = cross_validate(estimator, X_train, labels_train, cv=cv,
+                                    scoring=scorers,
+                                    n_jobs=min(self.cv_folds, N_CORES))
+        # cross_validate returns dict.
+        # Extract test scores
+        return [scores['test_{}'.format(txt)] for txt in self.metric_txt]
+
+    def evaluate_simulated(self, plot=False, histogram_data=None):
         """
         Trains the model in a 5-fold cross validation and returns a mean
         and standard deviation for each metric used for evaluation.
@@ -177,6 +571,10 @@ class RandomForestClassification():
         ----------
             plot: bool
                 Whether to show a plot or not.
+            histogram_data: HistogramData
+                If given, its training data is used instead of loading the
+                data and, for the 'uniform' strategy, its histogram range
+                is reused.
 
         Returns
         -------
@@ -184,25 +582,24 @@ class RandomForestClassification():
             std_scores: list of length len(self.metrics)
         """
         logger.info("Evaluating simulated data...")
-        pipeline = self._get_pipeline()
-        # Get the raw data for the features
-        logger.info("Loading data...")
-        raw_data_train = self._get_raw_data(train=True)
+        if histogram_data is None:
+            # Get the raw data for the features
+            logger.info("Loading data...")
+            histogram_data = HistogramData(self._get_raw_data(train=True))
+        if self.strategy == 'quantile':
+            # The bin edges are learned from the data, so they must be
+            # fitted on the training folds only to avoid leakage
+            estimator = self._get_pipeline()
+            X_train = histogram_data.data
+        else:
+            # The histogram range is taken over all samples, so the features
+            # do not depend on the fold and we extract them only once
+            estimator = self.classifier
+            X_train = histogram_data.get_features(self.n_bins)
         # Bring labels in correct format
         labels_train = self._get_labels()
 
-        # We have an unbalanced dataset, so we stratify
-        cv = StratifiedKFold(self.cv_folds, shuffle=True)
-
-        logger.info("Scoring for {} metrics...".format(len(self.metrics)))
-        # Produce scores for all scoring metrics
-        scorers = {txt: make_scorer(metric) for txt, metric in
-                   zip(self.metric_txt, self.metrics)}
-        scores = cross_validate(pipeline, raw_data_train, labels_train, cv=cv,
-                                scoring=scorers)
-        # cross_validate returns dict.
-        # Extract test scores
-        scores = [scores['test_{}'.format(txt)] for txt in self.metric_txt]
+        scores = self._cross_validate(estimator, X_train, labels_train)
 
         # We only want to keep mean and std for each metric
         scores_means = [np.mean(score) for score in scores]
@@ -219,7 +616,7 @@ class RandomForestClassification():
 
         # Write results to output file
         output_default_args = dict(
-            classifier=Classifier.randomforest,
+            classifier=self.classifier_type,
             task=Task.classification,
             data_type=DataType.simulated,
             definition=self.definition
@@ -250,6 +647,8 @@ class RandomForestClassification():
         """
         logger.info("Evaluating real data...")
         pipeline = self._get_pipeline()
+        # A single model is fitted, so it can use all cores
+        pipeline.set_params(model__n_jobs=N_CORES)
         # Get the raw data for the features
         raw_data_train = self._get_raw_data()
         # Bring labels in correct format
@@ -273,7 +672,7 @@ class RandomForestClassification():
 
         # Write results to output file
         output_default_args = dict(
-            classifier=Classifier.randomforest,
+            classifier=self.classifier_type,
             task=Task.classification,
             data_type=DataType.real,
             definition=self.definition
@@ -308,6 +707,9 @@ class RandomForestClassification():
             scores_std: list of length len(self.metrics) with
             standard deviations for each metric
         """
+        # matplotlib is only imported when plotting, as it is slow to load
+        import matplotlib.pyplot as ply
+
         ply.figure()
         ply.bar(self.metric_txt, scores_mean, yerr=scores_std, align='center',
                 alpha=0.5, ecolor='black', capsize=10)
@@ -322,15 +724,22 @@ class RandomForestClassification():
 def run_gridsearch():
     # Run gridsearch for n_bins
     print("n_bins --> scores for F1, ROCAUC, Accuracy")
+    # The raw data is the same for all n_bins, so we load it and compute
+    # the histogram range only once
+    histogram_data = HistogramData(load_variables(
+        args.input_path_train, RandomForestClassification.variables))
     for n_bins in [5, 10, 20, 30, 50, 80, 120, 150, 200]:
         model = RandomForestClassification(
             definition=args.definition,
             path_train=args.input_path_train,
             n_bins=n_bins,
-            n_estimators=1000
+            n_estimators=1000,
+            boosting=args.boosting,
+            strategy=args.strategy
         )
 
-        mean_scores, _ = model.evaluate_simulated(plot=False)
+        mean_scores, _ = model.evaluate_simulated(
+            plot=False, histogram_data=histogram_data)
         print("n_bins: {} --> {:.4f}, {:.4f}, {:.4f}".format(n_bins,
                                                              *mean_scores)
               )
@@ -369,6 +778,21 @@ if __name__ == '__main__':
         action="store",
         default="simulated"
     )
+    parser.add_argument(
+        "-b",
+        "--boosting",
+        help="Use a histogram-based XGBClassifier instead of RandomForest",
+        action="store_true",
+        default=False
+    )
+    parser.add_argument(
+        "-s",
+        "--strategy",
+        choices=("uniform", "quantile"),
+        help="Choose the binning strategy of the histograms",
+        action="store",
+        default="uniform"
+    )
     args = parser.parse_args()
 
     # n_bins was estimated via cross-validation on simulated data set
@@ -381,7 +805,9 @@ if __name__ == '__main__':
             path_train=args.input_path_train,
             n_bins=n_bins,
             n_estimators=n_estimators,
-            path_test=args.input_path_test
+            path_test=args.input_path_test,
+            boosting=args.boosting,
+            strategy=args.strategy
         )
         scores = model.evaluate_real()
     else:
@@ -389,6 +815,8 @@ if __name__ == '__main__':
             definition=args.definition,
             path_train=args.input_path_train,
             n_bins=n_bins,
-            n_estimators=n_estimators
+            n_estimators=n_estimators,
+            boosting=args.boosting,
+            strategy=args.strategy
         )
         model.evaluate_simulated()
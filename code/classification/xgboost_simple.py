@@ -26,7 +26,7 @@ class ManualAndXGBoost(FeatureEngineering):
     """
     variables = [DK.WIND_60, DK.WIND_65, DK.TEMP_60_90]
 
-    def __init__(self, definition):
+    def __init__(self, definition, device='cpu'):
         """The constructor of the ManualAndXgboost class. Also sets the random
         seed.
 
@@ -34,10 +34,29 @@ class ManualAndXGBoost(FeatureEngineering):
         ----------
             definition: string
                 the definition that you want to do classification for
+            device: string
+                the device used to train the XGBoostClassifier ('cpu' or
+                'cuda')
         """
         self.definition = definition
+        self.device = device
         SetSeed().set_seed()
 
+    def _tree_method(self):
+        """Returns the tree method of the XGBoostClassifier for the selected
+        device. The histogram methods bucket the features once and search
+        the splits over the buckets, which is much faster than the exact
+        method.
+
+        Returns
+        -------
+            tree_method: string
+                'gpu_hist' for the 'cuda' device and 'hist' otherwise
+        """
+        if self.device == 'cuda':
+            return 'gpu_hist'
+        return 'hist'
+
     def __get_labels(self, data_manager):
         """Returns the binary labels as a numpy array for the corresponding
         definition
@@ -53,10 +72,7 @@ class ManualAndXGBoost(FeatureEngineering):
                 A numpy array of size [num_data x 1] with the labels
         """
         labels = data_manager.get_data_for_variable(self.definition)
-        binary_labels = []
-        for label in labels:
-            binary_labels.append(int(np.any(label[:])))
-        labels = np.array(binary_labels)
+        labels = labels.any(axis=1).astype(np.int8)
         return labels
 
     def _bring_data_to_format(self, data_manager):
@@ -80,12 +96,9 @@ class ManualAndXGBoost(FeatureEngineering):
         # returns an array of dimensions (N, FC, D)
         temp_data = data_manager.get_data_for_variables(self.variables)
 
-        data = []
-        for i in range(len(temp_data)):
-            for j in range(len(temp_data[i])):
-                    data.append(temp_data[i, j])
-
-        data = np.array(data)
+        # (N, FC, D) -> (N*FC, D) is a view of a C-contiguous array
+        data = np.ascontiguousarray(temp_data).reshape(
+                -1, temp_data.shape[-1])
         return data
 
     def preprocess(self, path):
@@ -130,7 +143,8 @@ class ManualAndXGBoost(FeatureEngineering):
             model: XGBClassifier class
                 The trained model
         """
-        model = XGBClassifier(max_depth=5, n_estimators=1000, reg_alpha=0.1)
+        model = XGBClassifier(max_depth=5, n_estimators=1000, reg_alpha=0.1,
+                              tree_method=self._tree_method())
         model.fit(X_train, y_train)
         return model
 
@@ -154,7 +168,7 @@ class ManualAndXGBoost(FeatureEngineering):
                 function of scikit-learn
         """
         model = XGBClassifier(max_depth=5, n_estimators=1000,
-                              reg_alpha=0.1)
+                              reg_alpha=0.1, tree_method=self._tree_method())
 
         # this method will run 5 Stratified CV with a model initialized
         # previously and a scoring dictionary that contains auroc, accuracy and
@@ -272,9 +286,18 @@ if __name__ == '__main__':
             action="store_true",
             default=False
             )
+    parser.add_argument(
+            "-dev",
+            "--device",
+            choices=('cpu', 'cuda'),
+            help="Choose the device used to train the classifier",
+            action="store",
+            default="cpu"
+            )
     args = parser.parse_args()
     test = ManualAndXGBoost(
-            definition=args.definition
+            definition=args.definition,
+            device=args.device
             )
 
     scoring_sim = {
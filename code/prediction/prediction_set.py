@@ -52,17 +52,15 @@ class PredictionSetBase:
         """
 
         temp_labels = self.data_manager.get_data_for_variable(self.definition)
-        labels = np.zeros((temp_labels.shape[0], 1))
         # returns 1 if there is an SSW from the cutoff point day until the
         # prediction interval day
-        for i in range(len(temp_labels)):
-            labels[i, 0] = int(np.any(
-                temp_labels[
-                    i,
-                    self.cutoff_point + self.prediction_start_day:
-                    self.cutoff_point + self.prediction_start_day +
-                    self.prediction_interval
-                ]))
+        window = temp_labels[
+            :,
+            self.cutoff_point + self.prediction_start_day:
+            self.cutoff_point + self.prediction_start_day +
+            self.prediction_interval
+        ]
+        labels = window.any(axis=1).astype(np.int8).reshape(-1, 1)
         return labels
 
     def get_features(self):
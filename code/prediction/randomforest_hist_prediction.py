@@ -48,15 +48,41 @@ class HistogramTransformer(BaseEstimator, TransformerMixin):
             n_bins: int
                 number of bins to use in the histograms
         """
-        hist = np.apply_along_axis(
-            lambda a: np.histogram(a, bins=n_bins)[0],
-            axis=2, arr=data)
-        return hist
+        n_samples, n_features, n_days = data.shape
+        # Every histogram uses the range of its own time series. Like
+        # np.histogram, we widen an empty range to avoid zero-width bins
+        lo = data.min(axis=2, keepdims=True)
+        hi = data.max(axis=2, keepdims=True)
+        empty = lo == hi
+        dtype = np.result_type(data.dtype, np.float32)
+        lo = np.where(empty, lo - 0.5, lo).astype(dtype)
+        hi = np.where(empty, hi + 0.5, hi).astype(dtype)
+
+        # Find the bin of every value at once. The last bin is closed on
+        # the right, as in np.histogram
+        idx = ((data - lo) * (n_bins / (hi - lo))).astype(np.intp)
+        idx = np.clip(idx, 0, n_bins - 1)
+        # Rounding can put values lying on a bin edge into the neighbouring
+        # bin, so we compare against the edges like np.histogram does
+        step = (hi - lo) / n_bins
+        idx[data < idx.astype(dtype) * step + lo] -= 1
+        above = (data >= (idx + 1).astype(dtype) * step + lo) & \
+            (idx != n_bins - 1)
+        idx[above] += 1
+
+        # Offset the bin indices by (sample, variable) so that a single
+        # bincount yields all histograms
+        offsets = np.arange(n_samples * n_features) * n_bins
+        idx = idx.reshape(n_samples * n_features, n_days) + offsets[:, None]
+        hist = np.bincount(idx.ravel(),
+                           minlength=n_samples * n_features * n_bins)
+        return hist.reshape(n_samples, n_features, n_bins)
 
     def transform(self, X, y=None, **fit_params):
         histogram_features = self._histograms(X, n_bins=self.n_bins)
         X = np.reshape(histogram_features, (histogram_features.shape[0], -1))
-        return X
+        # The classifiers work on float32, so we avoid a float64 copy
+        return X.astype(np.float32)
 
     def fit(self, X, y=None, **fit_params):
         # No fitting required
@@ -103,7 +129,10 @@ class RandomForestPrediction(PredictionBaseModel):
         self.metrics = [f1_score, roc_auc_score, accuracy_score]
         self.metric_txt = ["F1", "ROCAUC", "Accuracy"]
 
-        self.classifier = RandomForestClassifier(n_estimators=n_estimators)
+        # We weight the classes instead of oversampling the unbalanced
+        # training data
+        self.classifier = RandomForestClassifier(n_estimators=n_estimators,
+                                                 class_weight='balanced')
 
     def evaluate(self, plot=False):
         """
@@ -146,9 +175,6 @@ class RandomForestPrediction(PredictionBaseModel):
             X_train = feature_extraction.fit_transform(X_train)
             X_test = feature_extraction.fit_transform(X_test)
 
-            # We only resample the training data
-            X_train, y_train = self._resample(X_train, y_train)
-
             # Train model
             model = self.classifier
             model.fit(X_train, y_train)
@@ -5,10 +5,9 @@ from xgboost import XGBClassifier
 from classification.xgboost_simple import ManualAndXGBoost
 from prediction_set import FixedWindowPredictionSet
 from sklearn.metrics import accuracy_score, f1_score, roc_auc_score
-from sklearn.model_selection import (GridSearchCV, StratifiedKFold,
+from sklearn.model_selection import (RandomizedSearchCV, StratifiedKFold,
                                      train_test_split)
 from utils.set_seed import SetSeed
-from imblearn.over_sampling import ADASYN
 from utils.enums import DataType, Task, Classifier
 from utils.output_class import Output
 
@@ -23,7 +22,7 @@ class XGBoostPredict(ManualAndXGBoost):
 
     def __init__(self, definition, cutoff_point, features_interval,
                  prediction_start_day, prediction_interval,
-                 features_importance):
+                 features_importance, device='cpu'):
         """The constructor of the XGBoostPredict class
         Parameters
         ----------
@@ -41,6 +40,9 @@ class XGBoostPredict(ManualAndXGBoost):
                 The interval where you will make predictions for
             features_importance: bool
                 Choose if you will print the top3 most important features
+            device: string
+                the device used to train the XGBoostClassifier ('cpu' or
+                'cuda')
         """
         self.definition = definition
         self.cutoff_point = cutoff_point
@@ -48,36 +50,37 @@ class XGBoostPredict(ManualAndXGBoost):
         self.prediction_start_day = prediction_start_day
         self.prediction_interval = prediction_interval
         self.feature_importances = features_importance
+        self.device = device
 
         # set the seed for all the libraries
         SetSeed().set_seed()
 
-    def _resample(self, data, labels):
-        """Resamples the data using the ADASYN algorithm.
+    def _scale_pos_weight(self, labels):
+        """Returns the ratio of negative to positive labels. It is used as
+        the scale_pos_weight of the XGBoostClassifier to correct the class
+        imbalance instead of oversampling the training set.
 
         Parameters
         ----------
-            data: numpy array
-                An array of the form [num_data, variable_count*dimensionality]
             labels: numpy array
-                An array of the form [num_data, 1]
+                An array of the form [num_data]
 
         Returns
         -------
-            X_train: numpy array
-                An array of the form [num_resampled_data*variable_count,
-                dimensionality]
-            y_train: numpy array
-                An array of the form [num_resampled_data, 1]
+            scale_pos_weight: float
+                The number of negative labels divided by the number of
+                positive labels
         """
-        X_train, y_train = ADASYN(n_jobs=16).fit_resample(data, labels)
-        return X_train, y_train
+        positives = np.sum(labels == 1)
+        return (len(labels) - positives) / max(positives, 1)
 
     def _stack_variables(self, temp_data):
-        """Brings data to the right format for resampling. More specifically
+        """Brings data to the format in which it is split into train and test
+        sets, which is also the input format of the autoencoders in
+        XGBoostAutoencodersPredict. More specifically
         it gets a 3D array of dimensions of (N, FC, D) and returns a 2D array
-        of dimensions (N*FC, D) where 3 consecutive lines belong in different
-        features
+        of dimensions (N, FC*D) where each row has all the variables of a
+        data point stacked horizontally
 
         Parameters
         -------
@@ -86,18 +89,12 @@ class XGBoostPredict(ManualAndXGBoost):
         Returns
         -------
             data: np.array
-                a numpy array of dimensions (N*FC, D)
+                a numpy array of dimensions (N, FC*D)
         """
         self.feature_count = temp_data.shape[1]
-        data = []
-        for i in range(len(temp_data)):
-            for j in range(len(temp_data[i])):
-                if j % self.feature_count == self.feature_count - 1:
-                    data.append(np.hstack((temp_data[i, j-2],
-                                           temp_data[i, j-1],
-                                           temp_data[i, j])))
-
-        return np.array(data)
+        # (N, FC, D) -> (N, FC*D) is a view of a C-contiguous array
+        data = np.ascontiguousarray(temp_data).reshape(len(temp_data), -1)
+        return data
 
     def _split_variables(self, temp_data):
         """Takes the data in the form where each row has all the variables
@@ -113,10 +110,9 @@ class XGBoostPredict(ManualAndXGBoost):
             data: numpy array
                 An array of the form [num_data*variable_count, dimensionality]
         """
-        data = [array for row in temp_data for array in
-                np.split(row, self.feature_count)]
-
-        return np.array(data)
+        data = np.ascontiguousarray(temp_data).reshape(
+                len(temp_data) * self.feature_count, -1)
+        return data
 
     def get_data_and_labels(self, path):
         """This function uses the FixedWindowPredictionSet class in order to
@@ -149,7 +145,10 @@ class XGBoostPredict(ManualAndXGBoost):
         return data, labels
 
     def tune_classifier(self, X_train, y_train):
-        """Finetunes the XGBoostClassifier for better ROCAUC
+        """Finetunes the XGBoostClassifier for better ROCAUC. Instead of
+        fitting the full grid, a random fifth of the parameter combinations
+        is evaluated.
+
         Parameters
         ----------
             X_train: numpy array
@@ -167,8 +166,14 @@ class XGBoostPredict(ManualAndXGBoost):
                 'reg_alpha': [0, 0.1, 5, 10, 100],
                 'reg_lambda': [0, 0.1, 5, 10, 100]
                 }
-        clf = GridSearchCV(XGBClassifier(), tuned_parameters, cv=5,
-                           scoring='roc_auc')
+        # The candidates are fitted in parallel, so every classifier uses a
+        # single job
+        clf = RandomizedSearchCV(
+                XGBClassifier(tree_method=self._tree_method(), n_jobs=1,
+                              scale_pos_weight=self._scale_pos_weight(
+                                  y_train)),
+                tuned_parameters, n_iter=45, cv=5, scoring='roc_auc',
+                n_jobs=-1)
         clf.fit(X_train, y_train)
         print("Best parameters set found on development set:")
         print()
@@ -200,15 +205,17 @@ class XGBoostPredict(ManualAndXGBoost):
         """
 
         model = XGBClassifier(n_estimators=1000, max_depth=5, reg_alpha=0.1,
-                              n_jobs=16)
+                              tree_method=self._tree_method(), n_jobs=16,
+                              scale_pos_weight=self._scale_pos_weight(
+                                  y_train))
         model.fit(X_train, y_train)
         return model
 
     def pipeline(self, X_train, y_train, X_test, y_test):
         """A method to pipeline the steps that need to be done in train and
-        test. First oversamples the training set and then calculates features
-        from the oversampled training set and the test set. After that it
-        trains a classifier on the training set and tests on the test set
+        test. First calculates features from the training set and the test
+        set. After that it trains a classifier, weighted for the class
+        imbalance, on the training set and tests on the test set
         Parameters
         ----------
             X_train: numpy array
@@ -226,7 +233,6 @@ class XGBoostPredict(ManualAndXGBoost):
                 A python dict with the scores in the same format like the
                 cross_validate function of scikit-learn
         """
-        X_train, y_train = self._resample(X_train, y_train)
         X_train = self._split_variables(X_train)
         X_test = self._split_variables(X_test)
         self.feature_keys, X_train = super()._produce_features(
@@ -377,6 +383,14 @@ if __name__ == "__main__":
             action="store_true",
             default=False
             )
+    parser.add_argument(
+            "-dev",
+            "--device",
+            choices=('cpu', 'cuda'),
+            help="Choose the device used to train the classifier",
+            action="store",
+            default="cpu"
+            )
     args = parser.parse_args()
     scoring = {
             'auroc': roc_auc_score,
@@ -389,7 +403,8 @@ if __name__ == "__main__":
             features_interval=args.features_interval,
             prediction_start_day=args.prediction_start_day,
             prediction_interval=args.prediction_interval,
-            features_importance=args.produce_importance
+            features_importance=args.produce_importance,
+            device=args.device
             )
     if args.data_type == 'sim':
         data, labels = test.get_data_and_labels(args.simulated_path)
@@ -42,10 +42,10 @@ class XGBoostAutoencodersPredict(XGBoostPredict):
 
     def pipeline(self, X_train, y_train, X_test, y_test):
         """A method to pipeline the steps that need to be done in train and
-        test. First oversamples the training set and then calculates features
-        from the oversampled training set using autoencoders. Then applies the
-        trained autoencoder to the test set. After that it
-        trains a classifier on the training set and tests on the test set
+        test. First calculates features from the training set using
+        autoencoders. Then applies the trained autoencoder to the test set.
+        After that it trains a classifier, weighted for the class imbalance,
+        on the training set and tests on the test set
         Parameters
         ----------
             X_train: numpy array
@@ -64,7 +64,6 @@ class XGBoostAutoencodersPredict(XGBoostPredict):
                 cross_validate function of scikit-learn
         """
 
-        X_train, y_train = self._resample(X_train, y_train)
         autoencoder = AutoEncoderTraining(self.batch_size,
                                           torch.cuda.is_available(),
                                           self.scale, flatten=False)
@@ -18,6 +18,9 @@ class Classifier:
     cnn = "cnn"
     rnn = "rnn"
     randomforest = "randomforest"
+    randomforest_quantile = "randomforest_quantile"
+    xgboost_hist = "xgboost_histogram"
+    xgboost_hist_quantile = "xgboost_histogram_quantile"
     cnn_max_pool = "cnn_max_pool"
 
 
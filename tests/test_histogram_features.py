@@ -0,0 +1,206 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+from sklearn.model_selection import StratifiedKFold, cross_validate
+
+import classification.randomforest_hist_classification as classification
+from classification.randomforest_hist_classification import \
+    HistogramData, HistogramTransformer, RandomForestClassification
+from prediction.randomforest_hist_prediction import \
+    HistogramTransformer as PredictionHistogramTransformer
+
+
+def random_data(dtype):
+    """Returns data of shape (n_samples, n_variables, n_days), where the
+    second variable has values on the bin edges and the third one is
+    constant"""
+    rng = np.random.RandomState(0)
+    return np.stack([
+        rng.normal(scale=10, size=(20, 50)),
+        np.round(rng.uniform(-5, 5, size=(20, 50)), 1),
+        np.full((20, 50), 3.7)
+    ], axis=1).astype(dtype)
+
+
+class TestUniformHistograms(unittest.TestCase):
+
+    def test_classification_transform(self):
+        for dtype in [np.float32, np.float64]:
+            data = random_data(dtype)
+            for n_bins in [1, 7, 10, 100]:
+                features = HistogramTransformer(n_bins=n_bins) \
+                    .transform(data)
+                # The range of a variable is taken over all samples
+                ranges = list(zip(data.min(axis=(0, 2)),
+                                  data.max(axis=(0, 2))))
+                expected = [
+                    np.concatenate([
+                        np.histogram(row, bins=n_bins, range=hist_range)[0]
+                        for row, hist_range in zip(sample, ranges)
+                    ])
+                    for sample in data
+                ]
+                np.testing.assert_array_equal(features, expected)
+
+    def test_classification_transform_with_range(self):
+        for dtype in [np.float32, np.float64]:
+            data = random_data(dtype)
+            # The range is narrower than the data, so values outside of it
+            # must be ignored
+            lo = np.array([-5, -2.5, 3.7])
+            hi = np.array([5, 2.5, 4.7])
+            features = HistogramTransformer(n_bins=10, hist_range=(lo, hi)) \
+                .transform(data)
+            expected = [
+                np.concatenate([
+                    np.histogram(row, bins=10, range=hist_range)[0]
+                    for row, hist_range in zip(sample, zip(lo, hi))
+                ])
+                for sample in data
+            ]
+            np.testing.assert_array_equal(features, expected)
+
+    def test_classification_transform_invalid_data(self):
+        transformer = HistogramTransformer(n_bins=10)
+        with self.assertRaises(ValueError):
+            transformer.transform(np.empty((0, 3, 50)))
+        for position in [(0, 1, 0), (5, 1, 20)]:
+            data = random_data(np.float64)
+            data[position] = np.nan
+            with self.assertRaises(ValueError):
+                transformer.transform(data)
+        data = random_data(np.float64)
+        data[3, 0, 7] = np.inf
+        with self.assertRaises(ValueError):
+            transformer.transform(data)
+
+    def test_histogram_data(self):
+        data = random_data(np.float64)
+        histogram_data = HistogramData(data)
+        # The range is only computed when uniform features are requested
+        self.assertIsNone(histogram_data.hist_range)
+        np.testing.assert_array_equal(
+            histogram_data.get_features(10),
+            HistogramTransformer(n_bins=10).transform(data))
+        self.assertIsNotNone(histogram_data.hist_range)
+
+    def test_prediction_transform(self):
+        for dtype in [np.float32, np.float64]:
+            data = random_data(dtype)
+            for n_bins in [1, 7, 10, 100]:
+                features = PredictionHistogramTransformer(n_bins=n_bins) \
+                    .transform(data)
+                # Every time series uses its own range
+                expected = [
+                    np.concatenate([np.histogram(row, bins=n_bins)[0]
+                                    for row in sample])
+                    for sample in data
+                ]
+                np.testing.assert_array_equal(features, expected)
+
+
+class TestQuantileHistograms(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        # Data of shape (n_samples, n_variables, n_days), where the second
+        # variable is discrete and the third one is constant
+        self.data = np.stack([
+            rng.exponential(size=(40, 30)),
+            rng.randint(0, 3, size=(40, 30)).astype(np.float64),
+            np.full((40, 30), 2.0)
+        ], axis=1)
+        self.labels = np.array([0, 1] * 20)
+
+    def test_fit(self):
+        transformer = HistogramTransformer(n_bins=10, strategy='quantile')
+        transformer.fit(self.data)
+        quantiles = np.linspace(0, 1, 11)
+        np.testing.assert_allclose(transformer.edges_[0],
+                                   np.quantile(self.data[:, 0, :], quantiles))
+        # Repeated quantiles are merged
+        np.testing.assert_array_equal(transformer.edges_[1], [0, 1, 2])
+        # A constant variable gets a single bin around its value
+        np.testing.assert_array_equal(transformer.edges_[2], [1.5, 2.5])
+
+    def test_transform(self):
+        transformer = HistogramTransformer(n_bins=10, strategy='quantile')
+        features = transformer.fit(self.data).transform(self.data)
+        self.assertEqual(features.shape, (40, 10 + 2 + 1))
+        self.assertEqual(features.dtype, np.float32)
+        # Every value of every variable falls in exactly one bin
+        np.testing.assert_array_equal(features[:, :10].sum(axis=1), 30)
+        np.testing.assert_array_equal(features[:, 10:12].sum(axis=1), 30)
+        np.testing.assert_array_equal(features[:, 12], 30)
+        expected = [np.histogram(row, bins=[0, 1, 2])[0]
+                    for row in self.data[:, 1, :]]
+        np.testing.assert_array_equal(features[:, 10:12], expected)
+
+    def test_transform_before_fit(self):
+        transformer = HistogramTransformer(n_bins=10, strategy='quantile')
+        with self.assertRaises(Exception):
+            transformer.transform(self.data)
+
+    def test_unknown_strategy(self):
+        transformer = HistogramTransformer(n_bins=10, strategy='quantiles')
+        with self.assertRaises(ValueError):
+            transformer.fit(self.data)
+        with self.assertRaises(ValueError):
+            transformer.transform(self.data)
+        with self.assertRaises(ValueError):
+            RandomForestClassification("CP07", "train.h5",
+                                       strategy='quantiles')
+
+    def test_cross_validation_fits_on_training_folds(self):
+        model = RandomForestClassification("CP07", "train.h5", n_bins=10,
+                                           n_estimators=5,
+                                           strategy='quantile')
+        cv = StratifiedKFold(4, shuffle=True, random_state=0)
+        scores = cross_validate(model._get_pipeline(), self.data,
+                                self.labels, cv=cv, return_estimator=True)
+        quantiles = np.linspace(0, 1, 11)
+        for (train, _), pipeline in zip(cv.split(self.data, self.labels),
+                                        scores['estimator']):
+            transformer = pipeline.named_steps['feature_extraction']
+            np.testing.assert_allclose(
+                transformer.edges_[0],
+                np.quantile(self.data[train, 0, :], quantiles))
+
+
+class TestCrossValidation(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        self.data = rng.normal(size=(60, 3, 30))
+        # Noisy labels, so that differently seeded forests disagree
+        self.labels = (self.data[:, 0, :].mean(axis=1) +
+                       rng.normal(scale=0.2, size=60) > 0).astype(np.int8)
+
+    def _scores(self, strategy):
+        np.random.seed(42)
+        model = RandomForestClassification("CP07", "train.h5", n_bins=10,
+                                           n_estimators=5, cv_folds=4,
+                                           strategy=strategy)
+        if strategy == 'quantile':
+            estimator, X_train = model._get_pipeline(), self.data
+        else:
+            estimator = model.classifier
+            X_train = HistogramTransformer(n_bins=10).transform(self.data)
+        # The folds run in worker processes even on machines with few cores
+        with mock.patch.object(classification, 'N_CORES', 4):
+            return model._cross_validate(estimator, X_train, self.labels)
+
+    def test_pipeline_does_not_change_classifier(self):
+        model = RandomForestClassification("CP07", "train.h5")
+        model._get_pipeline().set_params(model__n_jobs=4)
+        self.assertEqual(model.classifier.n_jobs, 1)
+
+    def test_parallel_runs_are_reproducible(self):
+        for strategy in ['uniform', 'quantile']:
+            np.testing.assert_array_equal(self._scores(strategy),
+                                          self._scores(strategy))
+
+
+if __name__ == '__main__':
+    unittest.main()